@@ -1,13 +1,41 @@
 import json
+import functools
 import hashlib
-import os
-from typing import List, TypeVar, Type, Dict
+import random
+import struct
+from typing import Iterable, List, TypeVar, Type, Dict, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _T = TypeVar("_T")
 
-@dataclass
+_LANES = struct.Struct("<8I")
+
+if orjson is not None:
+    def _json_loads(raw: bytes):
+        return orjson.loads(raw)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+else:
+    def _json_loads(raw: bytes):
+        return json.loads(raw)
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+_DEVICE_TEMPLATE = (
+    '{{"device_model":{0},"system_version":{1},"lang_code":{2},'
+    '"system_lang_code":{3},"app_version":{4},"lang_pack":{5},'
+    '"api_id":{6},"api_hash":{7}}}'
+)
+
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     device_model: str
     system_version: str
@@ -30,133 +58,128 @@ class DeviceInfo:
             "api_hash": self.api_hash
         }
 
+@dataclass(frozen=True, slots=True)
+class _EscapedPools:
+    device_models: List[str]
+    system_versions: List[str]
+    lang_codes: List[str]
+    system_lang_codes: List[str]
+    app_versions: List[str]
+    lang_packs: List[str]
+    api_id: List[str]
+    api_hash: List[str]
+
+_cache: Dict[Tuple[type, str], _EscapedPools] = {}
+
 class BaseDeviceGenerator:
-    device_list: List[DeviceInfo] = []
-    device_models: List[str | Dict] = []
-    system_versions: List[str | Dict] = []
-    lang_codes: List[str] = []
-    system_lang_codes: List[str] = []
-    app_versions: List[str] = []
-    lang_packs: List[str] = []
-    api_id: List[str] = []
-    api_hash: List[str] = []
     platform: str = ""
     data_dir: str = "data"
 
     @classmethod
-    def load_data(cls) -> None:
-        json_path = Path(cls.data_dir) / f"{cls.platform.lower()}.json"
+    def load_data(cls, data_dir: str = None) -> Dict[str, List | Dict]:
+        json_path = Path(cls.data_dir if data_dir is None else data_dir) / f"{cls.platform.lower()}.json"
         if not json_path.exists():
             raise FileNotFoundError(f"JSON file not found: {json_path}")
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        cls.device_models = data.get("device_models", [])
-        cls.system_versions = data.get("system_versions", [])
-        cls.lang_codes = data.get("lang_codes", [])
-        cls.system_lang_codes = data.get("system_lang_codes", cls.lang_codes)
-        cls.app_versions = data.get("app_versions", [])
-        cls.lang_packs = data.get("lang_packs", ["default"])
-        cls.api_id = data.get("api_id", [""])
-        cls.api_hash = data.get("api_hash", [""])
-        
-        cls.lang_packs = [lp for lp in cls.lang_packs if lp and isinstance(lp, str)]
-        if not cls.lang_packs:
-            cls.lang_packs = ["en-US"]  
+        data = _json_loads(json_path.read_bytes())
+        lang_codes = data.get("lang_codes", [])
+        lang_packs = [lp for lp in data.get("lang_packs", ["default"]) if lp and isinstance(lp, str)]
+        return {
+            "device_models": data.get("device_models", []),
+            "system_versions": data.get("system_versions", []),
+            "lang_codes": lang_codes,
+            "system_lang_codes": data.get("system_lang_codes", lang_codes),
+            "app_versions": data.get("app_versions", []),
+            "lang_packs": lang_packs or ["en-US"],
+            "api_id": data.get("api_id", [""]),
+            "api_hash": data.get("api_hash", [""]),
+        }
 
     @classmethod
-    def random_device(cls: Type['BaseDeviceGenerator'], unique_id: str = None) -> str:
-        hash_id = cls._str_to_hash_id(unique_id)
-        device_info = cls._random_device(hash_id)
-        return json.dumps(device_info.to_dict(), ensure_ascii=False)
+    def random_device(cls: Type['BaseDeviceGenerator'], unique_id: str = None, data_dir: str = None) -> str:
+        return cls._format_device(cls._generate(data_dir), cls._lanes_for(unique_id))
 
     @classmethod
-    def _random_device(cls, hash_id: int) -> DeviceInfo:
-        cls._generate()
-        device = cls._hash_to_value(hash_id, cls.device_list)
-        lang_code = cls._hash_to_value(hash_id + 1, cls.lang_codes)
-        system_lang_code = cls._hash_to_value(hash_id + 2, cls.system_lang_codes)
-        app_version = cls._hash_to_value(hash_id + 3, cls.app_versions)
-        lang_pack = cls._hash_to_value(hash_id + 4, cls.lang_packs)
-        api_id = cls._hash_to_value(hash_id + 5, cls.api_id)
-        api_hash = cls._hash_to_value(hash_id + 6, cls.api_hash)
-        return DeviceInfo(
-            device_model=device.device_model,
-            system_version=device.system_version,
-            lang_code=lang_code,
-            system_lang_code=system_lang_code,
-            app_version=app_version,
-            lang_pack=lang_pack,
-            api_id=api_id,
-            api_hash=api_hash
+    def random_device_batch(
+        cls: Type['BaseDeviceGenerator'], unique_ids: Iterable[str], data_dir: str = None
+    ) -> List[str]:
+        pools = cls._generate(data_dir)
+        return [cls._format_device(pools, cls._lanes_for(unique_id)) for unique_id in unique_ids]
+
+    @classmethod
+    def random_devices(
+        cls: Type['BaseDeviceGenerator'], n: int, seed: int = None, data_dir: str = None
+    ) -> List[str]:
+        pools = cls._generate(data_dir)
+        rng = random.Random(seed)
+        return [cls._format_device(pools, _LANES.unpack(rng.randbytes(_LANES.size))) for _ in range(n)]
+
+    @classmethod
+    def _format_device(cls, pools: _EscapedPools, lanes: Tuple[int, ...]) -> str:
+        model_idx, version_idx = divmod(
+            cls._hash_to_index(lanes[0], len(pools.device_models) * len(pools.system_versions)),
+            len(pools.system_versions),
+        )
+        return _DEVICE_TEMPLATE.format(
+            pools.device_models[model_idx],
+            pools.system_versions[version_idx],
+            cls._hash_to_value(lanes[1], pools.lang_codes),
+            cls._hash_to_value(lanes[2], pools.system_lang_codes),
+            cls._hash_to_value(lanes[3], pools.app_versions),
+            cls._hash_to_value(lanes[4], pools.lang_packs),
+            cls._hash_to_value(lanes[5], pools.api_id),
+            cls._hash_to_value(lanes[6], pools.api_hash),
         )
 
     @classmethod
-    def _generate(cls) -> None:
-        if not cls.device_list:
-            cls.load_data()
-            cls.device_list = []
-            if cls.platform == "iOS":
-                for model_id, suffixes in cls.device_models.items():
-                    base_model = f"iPhone {model_id}" if model_id != "SE" else "iPhone SE"
-                    for suffix in suffixes:
-                        model_name = f"{base_model}{suffix}".strip()
-                        for major, minors in cls.system_versions.items():
-                            for minor, patches in minors.items():
-                                version = f"{major}.{minor}" if not patches else f"{major}.{minor}.{patches[0]}"
-                                cls.device_list.append(DeviceInfo(
-                                    device_model=model_name,
-                                    system_version=version,
-                                    lang_code=cls.lang_codes[0] if cls.lang_codes else "en",
-                                    system_lang_code=cls.system_lang_codes[0] if cls.system_lang_codes else "en-US",
-                                    app_version=cls.app_versions[0] if cls.app_versions else "1.0.0",
-                                    lang_pack=cls.lang_packs[0] if cls.lang_packs else "default",
-                                    api_id=cls.api_id[0] if cls.api_id else "",
-                                    api_hash=cls.api_hash[0] if cls.api_hash else ""
-                                ))
-            elif cls.platform == "macOS":
-                for model in cls.device_models:
-                    for version in cls.system_versions:
-                        cls.device_list.append(DeviceInfo(
-                            device_model=model,
-                            system_version=version,
-                            lang_code=cls.lang_codes[0] if cls.lang_codes else "en",
-                            system_lang_code=cls.system_lang_codes[0] if cls.system_lang_codes else "en-US",
-                            app_version=cls.app_versions[0] if cls.app_versions else "1.0.0",
-                            lang_pack=cls.lang_packs[0] if cls.lang_packs else "macos",
-                            api_id=cls.api_id[0] if cls.api_id else "",
-                            api_hash=cls.api_hash[0] if cls.api_hash else ""
-                        ))
-            else:
-                
-                for model in cls.device_models:
-                    for version in cls.system_versions:
-                        cls.device_list.append(DeviceInfo(
-                            device_model=model,
-                            system_version=version,
-                            lang_code=cls.lang_codes[0] if cls.lang_codes else "en",
-                            system_lang_code=cls.system_lang_codes[0] if cls.system_lang_codes else "en-US",
-                            app_version=cls.app_versions[0] if cls.app_versions else "1.0.0",
-                            lang_pack=cls.lang_packs[0] if cls.lang_packs else "default",
-                            api_id=cls.api_id[0] if cls.api_id else "",
-                            api_hash=cls.api_hash[0] if cls.api_hash else ""
-                        ))
+    def _generate(cls, data_dir: str = None) -> _EscapedPools:
+        if data_dir is None:
+            data_dir = cls.data_dir
+        key = (cls, str(data_dir))
+        pools = _cache.get(key)
+        if pools is not None:
+            return pools
+        data = cls.load_data(data_dir)
+        if cls.platform == "iOS":
+            models = []
+            for model_id, suffixes in data["device_models"].items():
+                base_model = f"iPhone {model_id}" if model_id != "SE" else "iPhone SE"
+                models.extend(f"{base_model}{suffix}".strip() for suffix in suffixes)
+            versions = [
+                f"{major}.{minor}" if not patches else f"{major}.{minor}.{patches[0]}"
+                for major, minors in data["system_versions"].items()
+                for minor, patches in minors.items()
+            ]
+        else:
+            models, versions = data["device_models"], data["system_versions"]
+        pools = _EscapedPools(
+            device_models=[_json_dumps(m) for m in models],
+            system_versions=[_json_dumps(v) for v in versions],
+            lang_codes=[_json_dumps(v) for v in data["lang_codes"]],
+            system_lang_codes=[_json_dumps(v) for v in data["system_lang_codes"]],
+            app_versions=[_json_dumps(v) for v in data["app_versions"]],
+            lang_packs=[_json_dumps(v) for v in data["lang_packs"]],
+            api_id=[_json_dumps(v) for v in data["api_id"]],
+            api_hash=[_json_dumps(v) for v in data["api_hash"]],
+        )
+        _cache[key] = pools
+        return pools
 
     @classmethod
-    def _str_to_hash_id(cls, unique_id: str = None) -> int:
-        if unique_id is not None and not isinstance(unique_id, str):
-            unique_id = str(unique_id)
-        byte_id = os.urandom(32) if unique_id is None else unique_id.encode("utf-8")
-        return int(hashlib.sha1(byte_id).hexdigest(), 16) % (10 ** 12)
+    def _lanes_for(cls, unique_id: str = None) -> Tuple[int, ...]:
+        if unique_id is None:
+            return _LANES.unpack(random.randbytes(_LANES.size))
+        byte_id = unique_id.encode("utf-8") if isinstance(unique_id, str) else str(unique_id).encode("utf-8")
+        return _LANES.unpack(hashlib.blake2s(byte_id).digest())
 
     @classmethod
-    def _hash_to_value(cls, hash_id: int, values: List[_T]) -> _T:
-        if not values:
+    def _hash_to_index(cls, lane: int, size: int) -> int:
+        if not size:
             raise ValueError(f"No values available for {cls.platform}")
-        return values[hash_id % len(values)]
+        return (lane * size) >> 32
 
     @classmethod
-    def _clean_and_simplify(cls, text: str) -> str:
-        return " ".join(word for word in text.split() if word)
+    def _hash_to_value(cls, lane: int, values: List[_T]) -> _T:
+        return values[cls._hash_to_index(lane, len(values))]
 
 class WindowsDevice(BaseDeviceGenerator):
     platform = "Windows"
@@ -173,16 +196,25 @@ class AndroidDevice(BaseDeviceGenerator):
 class iOSDevice(BaseDeviceGenerator):
     platform = "iOS"
 
+_PLATFORM_CLASSES: Dict[str, Type[BaseDeviceGenerator]] = {
+    "Windows": WindowsDevice,
+    "Linux": LinuxDevice,
+    "macOS": macOSDevice,
+    "Android": AndroidDevice,
+    "iOS": iOSDevice
+}
+
 def get_random_device(platform: str, unique_id: str = None, data_dir: str = "data") -> str:
-    platform_classes = {
-        "Windows": WindowsDevice,
-        "Linux": LinuxDevice,
-        "macOS": macOSDevice,
-        "Android": AndroidDevice,
-        "iOS": iOSDevice
-    }
-    device_class = platform_classes.get(platform)
+    if unique_id is None:
+        return _get_random_device(platform, unique_id, data_dir)
+    return _get_random_device_cached(platform, str(unique_id), data_dir)
+
+def _get_random_device(platform: str, unique_id: str | None, data_dir: str) -> str:
+    device_class = _PLATFORM_CLASSES.get(platform)
     if not device_class:
         raise ValueError(f"Unsupported platform: {platform}")
-    device_class.data_dir = data_dir
-    return device_class.random_device(unique_id)
\ No newline at end of file
+    return device_class.random_device(unique_id, data_dir=data_dir)
+
+@functools.lru_cache(maxsize=4096)
+def _get_random_device_cached(platform: str, unique_id: str, data_dir: str) -> str:
+    return _get_random_device(platform, unique_id, data_dir)
\ No newline at end of file